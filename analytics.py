@@ -0,0 +1,230 @@
+import random
+from graph import ImplicitGraph
+
+
+class AdjacencyIndex:
+    """Flat (CSR) adjacency arrays of a Graph, for algorithms that go through the whole graph many times.
+    The neighbors of vertex i are targets[offsets[i]:offsets[i+1]], sorted by index, parallel edges are merged
+    (keeping the lowest weight) and loops are left out. Changes to the graph made later don't show in the index.
+    """
+
+    def __init__(self, g):
+        if isinstance(g, ImplicitGraph):
+            # its edges aren't stored in E, indexing it would silently give a graph without edges
+            raise TypeError("an implicit graph cannot be indexed, index its induced subgraph instead")
+        N = g.N
+        self.N = N
+        self.is_directed = g.is_directed
+        self.is_weighted = g.is_weighted
+        # number of edges at each vertex, as in the graph (parallel edges and loops included)
+        degrees = [0] * N
+        self.degrees = degrees
+
+        out = [{} for _ in range(N)]
+        both = [{} for _ in range(N)] if g.is_directed else out
+        edges = 0
+        for e in g.E:
+            if not e.connected:
+                continue
+            edges += 1
+            v, w, weight = e.v.index, e.w.index, e.weight
+            degrees[v] += 1
+            degrees[w] += 1
+            if v == w:
+                continue
+
+            x = out[v]
+            if not w in x or x[w] > weight:
+                x[w] = weight
+            if g.is_directed:
+                both[v][w] = both[w][v] = True
+            else:
+                x = out[w]
+                if not v in x or x[v] > weight:
+                    x[v] = weight
+        self.edges = edges
+
+        # weights is None in non-weighted graphs, every edge has weight 1 there
+        self.offsets, self.targets, self.weights = self._flatten(out, g.is_weighted)
+        if g.is_directed:
+            # the underlying undirected graph, used for triangles and clustering
+            self.undirected_offsets, self.undirected_targets, _ = self._flatten(both, False)
+        else:
+            self.undirected_offsets, self.undirected_targets = self.offsets, self.targets
+
+    @staticmethod
+    def _flatten(adjacency, weighted):
+        offsets = [0]
+        targets = []
+        weights = [] if weighted else None
+        for x in adjacency:
+            keys = sorted(x)
+            targets.extend(keys)
+            if weighted:
+                weights.extend([x[k] for k in keys])
+            offsets.append(len(targets))
+        return offsets, targets, weights
+
+    def neighbors(self, v):
+        return self.targets[self.offsets[v]:self.offsets[v+1]]
+
+    def undirected_neighbors(self, v):
+        return self.undirected_targets[self.undirected_offsets[v]:self.undirected_offsets[v+1]]
+
+    def eccentricity(self, v):
+        """bfs from v, distances are in number of edges (weights are ignored)
+
+        Args:
+            v (int): index of the starting vertex
+
+        Returns:
+            tuple: (eccentricity of v, index of the farthest vertex from v, number of vertices reached)
+                only the vertices reachable from v are taken into account
+        """
+        offsets, targets = self.offsets, self.targets
+        # level by level, with set operations doing the inner loop
+        seen = {v}
+        frontier = [v]
+        distance, reached = -1, 0
+        while frontier:
+            distance += 1
+            reached += len(frontier)
+            last = frontier
+            new = set()
+            for x in last:
+                new.update(targets[offsets[x]:offsets[x+1]])
+            new.difference_update(seen)
+            seen.update(new)
+            frontier = list(new)
+        return distance, last[0], reached
+
+
+def degree_histogram(index):
+    """
+    Returns:
+        dict: degree -> number of vertices with that degree, sorted by degree
+    """
+    histogram = {}
+    for d in index.degrees:
+        histogram[d] = histogram.get(d, 0) + 1
+    return dict(sorted(histogram.items()))
+
+
+def diameter_estimate(index, samples=16, seed=None):
+    """estimates the diameter and eccentricities (in number of edges) using a few bfs runs
+
+    The double sweep - bfs from the vertex with the highest degree and then from the vertex farthest from it -
+    gives a lower bound of the diameter. The eccentricities of sampled vertices are then added to the estimate.
+
+    Args:
+        index (AdjacencyIndex): index of the graph
+        samples (int, optional): number of randomly chosen vertices to compute the eccentricity of. Defaults to 16.
+        seed (optional): seed of the random sampling. Defaults to None.
+
+    Returns:
+        dict: "diameter_lower_bound", "eccentricity" (its "samples", "min", "max" and "mean")
+    """
+    if index.N == 0:
+        return {"diameter_lower_bound": None, "eccentricity": None}
+
+    start = max(range(index.N), key=lambda x: index.degrees[x])
+    lower_bound, farthest, _ = index.eccentricity(start)
+    lower_bound = max(lower_bound, index.eccentricity(farthest)[0])
+
+    rng = random.Random(seed)
+    sampled = rng.sample(range(index.N), min(samples, index.N))
+    eccentricities = [index.eccentricity(x)[0] for x in sampled]
+    if eccentricities:
+        lower_bound = max(lower_bound, max(eccentricities))
+        eccentricity = {
+            "samples": len(eccentricities),
+            "min": min(eccentricities),
+            "max": max(eccentricities),
+            "mean": sum(eccentricities) / len(eccentricities)
+        }
+    else:
+        eccentricity = None
+    return {"diameter_lower_bound": lower_bound, "eccentricity": eccentricity}
+
+
+def triangles(index):
+    """counts triangles of the underlying undirected graph
+
+    Every triangle is found only once - from its vertex which is first in the degree ordering,
+    going only to neighbors later in the ordering, which keeps the lists of high-degree vertices short.
+
+    Args:
+        index (AdjacencyIndex): index of the graph
+
+    Returns:
+        tuple: (number of triangles, list with the number of triangles at every vertex)
+    """
+    N = index.N
+    offsets, targets = index.undirected_offsets, index.undirected_targets
+
+    rank = [0] * N
+    for i, x in enumerate(sorted(range(N), key=lambda x: (offsets[x+1] - offsets[x], x))):
+        rank[x] = i
+    forward = [[y for y in targets[offsets[x]:offsets[x+1]] if rank[y] > rank[x]] for x in range(N)]
+
+    total = 0
+    at_vertex = [0] * N
+    for x in range(N):
+        later = forward[x]
+        if len(later) < 2:
+            continue
+        later_set = set(later)
+        for y in later:
+            common = later_set.intersection(forward[y])
+            if common:
+                total += len(common)
+                at_vertex[x] += len(common)
+                at_vertex[y] += len(common)
+                for z in common:
+                    at_vertex[z] += 1
+    return total, at_vertex
+
+
+def clustering(index, at_vertex):
+    """
+    Args:
+        index (AdjacencyIndex): index of the graph
+        at_vertex (list): number of triangles at every vertex (from triangles)
+
+    Returns:
+        tuple: (average clustering coefficient, transitivity)
+    """
+    offsets = index.undirected_offsets
+    coefficients = 0
+    wedges = 0
+    for x in range(index.N):
+        d = offsets[x+1] - offsets[x]
+        if d > 1:
+            coefficients += 2 * at_vertex[x] / (d * (d - 1))
+            wedges += d * (d - 1) // 2
+
+    average = coefficients / index.N if index.N else 0
+    transitivity = sum(at_vertex) / wedges if wedges else 0
+    return average, transitivity
+
+
+def graph_stats(g, samples=16, seed=None):
+    """computes the statistics of a graph, the adjacency index is built once and shared by all of them
+
+    Args:
+        g (Graph): the graph
+        samples (int, optional): number of vertices to compute the eccentricity of. Defaults to 16.
+        seed (optional): seed of the random sampling. Defaults to None.
+
+    Returns:
+        dict: "vertices", "edges", "degree_histogram", "diameter_lower_bound", "eccentricity",
+            "triangles", "average_clustering" and "transitivity"
+    """
+    index = AdjacencyIndex(g)
+    r = {"vertices": index.N, "edges": index.edges, "degree_histogram": degree_histogram(index)}
+    r.update(diameter_estimate(index, samples, seed))
+
+    total, at_vertex = triangles(index)
+    r["triangles"] = total
+    r["average_clustering"], r["transitivity"] = clustering(index, at_vertex)
+    return r
@@ -0,0 +1,246 @@
+import math, os, random
+from heapq import heappush, heappop
+from concurrent.futures import ProcessPoolExecutor
+from analytics import AdjacencyIndex
+
+# the index of the graph in worker processes, set once per process so it isn't sent with every batch
+_worker_index = None
+
+
+def _single_source(index, s):
+    """shortest paths from s (bfs, or Dijkstra's algorithm in weighted graphs)
+
+    Args:
+        index (AdjacencyIndex): index of the graph
+        s (int): index of the starting vertex
+
+    Returns:
+        tuple: (reached vertices ordered by their distance, distances (None if unreachable), numbers of shortest paths)
+    """
+    offsets, targets, weights = index.offsets, index.targets, index.weights
+    distance = [None] * index.N
+    sigma = [0] * index.N
+    distance[s] = 0
+    sigma[s] = 1
+
+    if weights is None:
+        order = [s]
+        i = 0
+        while i < len(order):
+            v = order[i]
+            i += 1
+            d, paths = distance[v] + 1, sigma[v]
+            for w in targets[offsets[v]:offsets[v+1]]:
+                if distance[w] is None:
+                    distance[w] = d
+                    sigma[w] = paths
+                    order.append(w)
+                elif distance[w] == d:
+                    sigma[w] += paths
+        return order, distance, sigma
+
+    order = []
+    queue = [(0, s)]
+    while queue:
+        d, v = heappop(queue)
+        if d > distance[v]:
+            continue
+        order.append(v)
+        paths = sigma[v]
+        for k in range(offsets[v], offsets[v+1]):
+            w, new = targets[k], d + weights[k]
+            if distance[w] is None or new < distance[w]:
+                distance[w] = new
+                sigma[w] = paths
+                heappush(queue, (new, w))
+            elif new == distance[w]:
+                sigma[w] += paths
+    return order, distance, sigma
+
+
+def _accumulate(index, sources, dependencies=True):
+    """runs the single-source search from every source and adds up the results
+
+    Returns:
+        tuple: (sums of dependencies (Brandes), sums of distances from the sources, numbers of sources reaching the vertex)
+    """
+    N = index.N
+    offsets, targets, weights = index.offsets, index.targets, index.weights
+    between = [0.0] * N
+    distances = [0] * N
+    reach = [0] * N
+
+    for s in sources:
+        order, distance, sigma = _single_source(index, s)
+        for v in order[1:]:
+            distances[v] += distance[v]
+            reach[v] += 1
+        if not dependencies:
+            continue
+
+        # going from the farthest vertices back, every vertex collects the dependencies of
+        # the neighbors it lies on a shortest path to
+        delta = [0.0] * N
+        for v in reversed(order):
+            d = distance[v]
+            collected = 0.0
+            for k in range(offsets[v], offsets[v+1]):
+                w = targets[k]
+                if distance[w] == d + (1 if weights is None else weights[k]):
+                    collected += (1 + delta[w]) / sigma[w]
+            delta[v] = sigma[v] * collected
+            if v != s:
+                between[v] += delta[v]
+
+    return between, distances, reach
+
+
+def _set_worker_index(index):
+    global _worker_index
+    _worker_index = index
+
+
+def _accumulate_batch(sources, dependencies):
+    return _accumulate(_worker_index, sources, dependencies)
+
+
+def _run_sources(index, sources, dependencies, workers):
+    if workers <= 0:workers = os.cpu_count() or 1
+    if workers == 1 or len(sources) < 2:
+        return _accumulate(index, sources, dependencies)
+
+    # a few batches per worker, so that a slow batch doesn't keep the others waiting
+    size = max(1, math.ceil(len(sources) / (workers * 4)))
+    batches = [sources[i:i+size] for i in range(0, len(sources), size)]
+
+    r = [[0] * index.N for _ in range(3)]
+    with ProcessPoolExecutor(workers, initializer=_set_worker_index, initargs=(index,)) as pool:
+        for partial in pool.map(_accumulate_batch, batches, [dependencies] * len(batches)):
+            for total, part in zip(r, partial):
+                for i, x in enumerate(part):
+                    if x:total[i] += x
+    return r
+
+
+def sample_size(N, epsilon, delta=0.1):
+    """number of sampled sources, with which every betweenness estimate is within epsilon (relative to its maximum possible value)
+    with probability at least 1 - delta (Hoeffding's inequality for every vertex, joined by the union bound).
+    The bound doesn't hold for closeness, which is a ratio of two estimates.
+
+    Args:
+        N (int): number of vertices
+        epsilon (float): allowed error
+        delta (float, optional): allowed probability of a bigger error. Defaults to 0.1.
+
+    Returns:
+        int: number of sources, at most N (then the result is exact)
+    """
+    if N == 0:
+        return 0
+    return min(N, math.ceil(math.log(2 * N / delta) / (2 * epsilon ** 2)))
+
+
+def _sources(index, samples, epsilon, delta, seed):
+    if samples is None and not epsilon is None:
+        samples = sample_size(index.N, epsilon, delta)
+    if samples is None or samples >= index.N:
+        return list(range(index.N))
+    return random.Random(seed).sample(range(index.N), samples)
+
+
+def _betweenness(index, sources, between):
+    scale = index.N / len(sources)
+    if not index.is_directed:
+        # every path was counted from both of its ends
+        scale /= 2
+    return [x * scale for x in between]
+
+
+def _closeness(index, sources, distances, reach):
+    scale = index.N / len(sources)
+    r = []
+    for total, reached in zip(distances, reach):
+        if total == 0:
+            r.append(0.0)
+            continue
+        reached_all = min(index.N - 1, reached * scale)
+        r.append(reached / total * reached_all / (index.N - 1))
+    return r
+
+
+def centrality(g, samples=None, epsilon=None, delta=0.1, workers=1, seed=None):
+    """betweenness and closeness centrality of every vertex, both from the same searches (and the same sampled sources)
+    see betweenness and closeness for the details, epsilon and delta only give a guarantee for betweenness
+
+    Args:
+        g (Graph or AdjacencyIndex): the graph, an index can be reused between calls
+        samples (int, optional): number of sampled sources. Defaults to None (all of them, exact result).
+        epsilon (float, optional): allowed error of betweenness, sets the number of samples if samples isn't given. Defaults to None.
+        delta (float, optional): allowed probability of a bigger error. Defaults to 0.1.
+        workers (int, optional): number of processes to split the sources between (0 = one per CPU). Defaults to 1.
+        seed (optional): seed of the random sampling. Defaults to None.
+
+    Returns:
+        tuple: (list of betweenness, list of closeness), both indexed by vertex index
+    """
+    index = g if isinstance(g, AdjacencyIndex) else AdjacencyIndex(g)
+    sources = _sources(index, samples, epsilon, delta, seed)
+    if not sources or index.N < 2:
+        return [0.0] * index.N, [0.0] * index.N
+
+    between, distances, reach = _run_sources(index, sources, True, workers)
+    return _betweenness(index, sources, between), _closeness(index, sources, distances, reach)
+
+
+def betweenness(g, samples=None, epsilon=None, delta=0.1, workers=1, seed=None):
+    """betweenness centrality of every vertex (Brandes' algorithm)
+
+    With samples (or epsilon), only a random sample of sources is searched from and the result is scaled up.
+    The error is then at most epsilon * N * (N-2) (half of that in undirected graphs) with probability 1 - delta.
+
+    Args:
+        g (Graph or AdjacencyIndex): the graph, an index can be reused between calls
+        samples (int, optional): number of sampled sources. Defaults to None (all of them, exact result).
+        epsilon (float, optional): allowed error, sets the number of samples if samples isn't given. Defaults to None.
+        delta (float, optional): allowed probability of a bigger error. Defaults to 0.1.
+        workers (int, optional): number of processes to split the sources between (0 = one per CPU). Defaults to 1.
+        seed (optional): seed of the random sampling. Defaults to None.
+
+    Returns:
+        list: betweenness of every vertex, indexed by vertex index
+    """
+    index = g if isinstance(g, AdjacencyIndex) else AdjacencyIndex(g)
+    sources = _sources(index, samples, epsilon, delta, seed)
+    if not sources:
+        return [0.0] * index.N
+
+    return _betweenness(index, sources, _run_sources(index, sources, True, workers)[0])
+
+
+def closeness(g, samples=None, epsilon=None, delta=0.1, workers=1, seed=None):
+    """closeness centrality of every vertex: (r-1)/(sum of distances) * (r-1)/(N-1), where r-1 is the number of
+    vertices from which the vertex can be reached, so that vertices reachable from only a few others don't get a high score.
+    In directed graphs, the distances towards the vertex are used.
+
+    With samples (or epsilon), only the distances from a random sample of sources are used to estimate the sums.
+    epsilon only sets the number of samples with the same formula as for betweenness (sample_size),
+    there is no guarantee on the error of closeness.
+
+    Args:
+        g (Graph or AdjacencyIndex): the graph, an index can be reused between calls
+        samples (int, optional): number of sampled sources. Defaults to None (all of them, exact result).
+        epsilon (float, optional): sets the number of samples by sample_size if samples isn't given. Defaults to None.
+        delta (float, optional): passed to sample_size with epsilon. Defaults to 0.1.
+        workers (int, optional): number of processes to split the sources between (0 = one per CPU). Defaults to 1.
+        seed (optional): seed of the random sampling. Defaults to None.
+
+    Returns:
+        list: closeness of every vertex, indexed by vertex index
+    """
+    index = g if isinstance(g, AdjacencyIndex) else AdjacencyIndex(g)
+    sources = _sources(index, samples, epsilon, delta, seed)
+    if not sources or index.N < 2:
+        return [0.0] * index.N
+
+    _, distances, reach = _run_sources(index, sources, False, workers)
+    return _closeness(index, sources, distances, reach)
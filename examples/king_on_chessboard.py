@@ -1,35 +1,43 @@
-from graph import Graph
+from graph import ImplicitGraph
 """
 given a list of obsticles, find the shortest path of a king from start to end points.
 """
 class Chessboard:
 
-    def __init__(self, obsticles):
+    def __init__(self, obsticles, size=8):
         # vertices represent squares, sorted line by line
-        self.g = Graph(64)
-        self.obsticles = [x-1 + (y-1)*8 for x,y in obsticles]
-        
-        for i in range(64):
-            if i%8 != 7:
-                self.connect_spaces(i, i+1)
-            if i < 56:
-                self.connect_spaces(i, i+8)
-            if i%8 != 7 and i < 56:
-                self.connect_spaces(i, i+9)
-
-    def connect_spaces(self, i, j):
-        if not (i in self.obsticles or j in self.obsticles):
-            self.g.connect(self.g.vertex(i), self.g.vertex(j))
+        # the edges are never stored, the graph asks neighbors() for them when it needs them
+        self.size = size
+        self.obsticles = set(x-1 + (y-1)*size for x,y in obsticles)
+        self.g = ImplicitGraph(size*size, self.neighbors)
+
+    def neighbors(self, i):
+        if i in self.obsticles:
+            return []
+        x, y = i % self.size, i // self.size
+        r = []
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                if (dx or dy) and 0 <= x+dx < self.size and 0 <= y+dy < self.size:
+                    j = i + dx + dy*self.size
+                    if not j in self.obsticles:
+                        r.append(j)
+        return r
 
     def calculate_path(self, start, end):
-        start, end = start[0]-1 + (start[1]-1)*8, end[0]-1 + (end[1]-1)*8
-        path = self.g.find_path(self.g.vertex(start), self.g.vertex(end))
+        start, end = start[0]-1 + (start[1]-1)*self.size, end[0]-1 + (end[1]-1)*self.size
+
+        # a king needs at least max(|dx|, |dy|) moves, which makes a good A* heuristic
+        ex, ey = end % self.size, end // self.size
+        heuristic = lambda v: max(abs(v.index % self.size - ex), abs(v.index // self.size - ey))
+
+        path = self.g.find_path(self.g.vertex(start), self.g.vertex(end), heuristic)
         path_as_vertices = path.bfs(path.vertex(-1))
-        
+
         r = []
         for vertex in path_as_vertices:
-            x = vertex.value % 8 + 1
-            y = vertex.value//8 + 1
+            x = vertex.value % self.size + 1
+            y = vertex.value//self.size + 1
             r.append([x, y])
 
         return r
@@ -46,4 +54,4 @@ end = [3, 3]
 
 chb = Chessboard(obsticles)
 
-print(chb.calculate_path(start, end))
\ No newline at end of file
+print(chb.calculate_path(start, end))
@@ -1,4 +1,8 @@
 from queue import Queue, PriorityQueue
+from weakref import WeakValueDictionary
+
+# number of vertices in one chunk of a snapshot, publishing copies only the chunks with changed vertices
+_CHUNK = 256
 
 
 class Edge:
@@ -85,6 +89,8 @@ class Vertex:
         self.E = []
         self.distance = None
         self.component = None
+        # cached immutable copy of the value and edges for snapshots, None when it has to be rebuilt
+        self._row = None
 
     def __hash__(self):
         return hash(self.index)
@@ -114,6 +120,12 @@ class Vertex:
             return [(edge.backward(self.index), edge.weight) for edge in self.E if not edge.backward(self.index) is None]
         return [edge.backward(self.index) for edge in self.E if not edge.backward(self.index) is None]
 
+    def _get_row(self):
+        if self._row is None:
+            edges = tuple((e.index, e.v.index, e.w.index, e.weight, e.directed) for e in self.E if e.connected)
+            self._row = (self.value, edges)
+        return self._row
+
 
 class Graph:
     def __init__(self, N=0, values=[], multigraph=False, directed=False, weighted=False):
@@ -125,6 +137,32 @@ class Graph:
         if len(values) != N:
             values = [i for i in range(N)]
         self.V = [Vertex(i, values[i]) for i in range(N)]
+        self._snapshot = None
+        self._version = 0
+        self._reset_chunks()
+
+    def __getstate__(self):
+        # pickled as flat lists, pickling the vertices and edges themselves would recurse through the whole graph
+        state = self.__dict__.copy()
+        state["V"] = [x.value for x in self.V]
+        state["E"] = [(e.v.index, e.w.index, e.weight, e.directed, e.connected) for e in self.E]
+        state["_snapshot"], state["_chunks"], state["_dirty"] = None, None, None
+        return state
+
+    def __setstate__(self, state):
+        values, edges = state.pop("V"), state.pop("E")
+        self.__dict__.update(state)
+        self.V = [Vertex(i, values[i]) for i in range(len(values))]
+        self.E = []
+        # the edges were already checked by connect when they were created, they are just put back
+        for i, (v, w, weight, directed, connected) in enumerate(edges):
+            v, w = self.V[v], self.V[w]
+            edge = Edge(v, w, directed, i, weight)
+            edge.connected = connected
+            self.E.append(edge)
+            v.E.append(edge)
+            w.E.append(edge)
+        self._reset_chunks()
 
     def __repr__(self):
         return f"{self.N}-Graph(" + ", ".join([str(x) for x in self.E if x.connected]) + ")"
@@ -152,6 +190,61 @@ class Graph:
             self.E.append(edge)
             v.E.append(edge)
             w.E.append(edge)
+            if not self._chunks is None:
+                self._changed(v)
+                self._changed(w)
+
+    def disconnect(self, edge):
+        """Removes an edge from the graph (the edge stays in E, but its connected attribute is set to False)
+
+        Args:
+            edge (Edge): the edge to remove
+        """
+        edge.connected = False
+        if not self._chunks is None:
+            self._changed(edge.v)
+            self._changed(edge.w)
+
+    def _changed(self, v):
+        v._row = None
+        self._dirty.add(v.index // _CHUNK)
+
+    def _reset_chunks(self):
+        # nothing is tracked until the next publish, which builds all the chunks
+        self._chunks = None
+        self._dirty = set()
+
+    def publish(self):
+        """Publishes the current state of the graph as a new snapshot, which will be returned by snapshot()
+        Only the chunks of vertices changed since the last publish are copied, the rest is shared with the older snapshots.
+        It has to be called from the thread which changes the graph. Until the first publish, the graph doesn't
+        keep anything for snapshots.
+
+        Returns:
+            GraphSnapshot: the new snapshot
+        """
+        if self._chunks is None:
+            self._chunks = []
+            self._dirty = set(range((self.N + _CHUNK - 1) // _CHUNK))
+        for c in sorted(self._dirty):
+            rows = tuple(x._get_row() for x in self.V[c * _CHUNK:(c + 1) * _CHUNK])
+            if c < len(self._chunks):self._chunks[c] = rows
+            else:self._chunks.append(rows)
+        self._dirty = set()
+
+        self._version += 1
+        snapshot = GraphSnapshot(self, tuple(self._chunks), self.N, self._version)
+        # a single assignment, readers either get the old snapshot or the new one
+        self._snapshot = snapshot
+        return snapshot
+
+    def snapshot(self):
+        """Gets the last published snapshot of the graph, it's safe to read from any thread without locking.
+
+        Returns:
+            GraphSnapshot: the snapshot, None if the graph was never published
+        """
+        return self._snapshot
 
     def vertex(self, index=None, value=None):
         """gets a Vertex object with a given index or value
@@ -185,16 +278,24 @@ class Graph:
         """
         if self.N == 0: raise Exception("No vertices to go through")
         if v is None:
-            v = self.V[0]
+            v = self.vertex(0)
 
         if past is None:
-            past = [None for _ in range(self.N)]
+            past = self._vertex_map()
         yield v
         past[v.index] = True
-        for x in v.neighbors():
-            if past[x.index] is None:
-                for y in self.dfs(x, past=past):
-                    yield y
+
+        # a stack of unfinished neighbor lists instead of recursion, so deep graphs don't hit the recursion limit
+        stack = [iter(v.neighbors())]
+        while stack:
+            for x in stack[-1]:
+                if past[x.index] is None:
+                    yield x
+                    past[x.index] = True
+                    stack.append(iter(x.neighbors()))
+                    break
+            else:
+                stack.pop()
 
     def bfs(self, v=None, priority=None, edge=False):
         """Breadth first search (generator)
@@ -207,7 +308,7 @@ class Graph:
             Vertex: Vertices of the component one by one
         """
         if v is None:
-            v = self.V[0]
+            v = self.vertex(0)
 
         if priority is None:
             queue = Queue()
@@ -216,19 +317,19 @@ class Graph:
             queue = PriorityQueue()
             queue.put((priority(v), v))
 
-        past = [None for _ in range(self.N)]
+        past = self._vertex_map()
         past[v.index] = True
 
         if edge:
-            origin = [None for _ in range(self.N)]
-            weight = [None for _ in range(self.N)]
+            origin = self._vertex_map()
+            weight = self._vertex_map()
 
         while not queue.empty():
             v = queue.get()
             if not priority is None:
                 v = v[1]
             
-            if edge:yield v, origin[v.index], weight[v.distance]
+            if edge:yield v, origin[v.index], weight[v.index]
             else:yield v
             
             for x, d in v.neighbors(distance=True):
@@ -244,39 +345,49 @@ class Graph:
                     else:
                         queue.put((priority(x), x))
 
-    def find_distance(self, v, u=None):
+    def find_distance(self, v, u=None, heuristic=None):
         """Finds distance between two vertices, sets the value of "distance" of every vertex to its distance from v
 
         Args:
             v (Vertex): The vertex from which to calculate the distance
             u (Vertex, optional): The vertex to which to calculate the distance. Defaults to None.
+            heuristic (function, optional): estimate of the distance from a vertex to u, turns the search into A*.
+                It must never overestimate, not even by going through another vertex (h(x) <= weight(x, y) + h(y)). Defaults to None.
 
         Returns:
             int: Distance from u to v. None if there is no path between them or u wasn't specified
         """
-        for x in self.V:
-            x.distance = None
+        self._reset_distances()
         v.distance = 0
 
-        priority = (lambda x: x.distance) if self.is_weighted else None
-        for w in self.bfs(v, priority):
-            if (not u is None) and w == u:
-                return w.distance
-            for vertex, weight in w.neighbors(True):
-                if vertex.distance is None or vertex.distance > w.distance + weight:
-                    vertex.distance = w.distance + weight
+        if not self.is_weighted and heuristic is None:
+            for w in self.bfs(v):
+                if (not u is None) and w == u:
+                    return w.distance
+                for vertex, weight in w.neighbors(True):
+                    if vertex.distance is None or vertex.distance > w.distance + weight:
+                        vertex.distance = w.distance + weight
+            return None
 
-    def find_path(self, v, u):
+        distance, _, reached = self._dijkstra(v, u, heuristic)
+        for x in reached:
+            x.distance = distance[x.index]
+        if (not u is None) and not distance[u.index] is None:
+            return distance[u.index]
+        return None
+
+    def find_path(self, v, u, heuristic=None):
         """Finds the shortest path between two vertices
 
         Args:
             v (Vertex): Starting point
             u (Vertex): Ending point
+            heuristic (function, optional): A* heuristic, see find_distance. Defaults to None.
 
         Returns:
-            list: List of vertices through which the path leads
+            Graph: The path, the first vertex is u, the last one is v
         """
-        d = self.find_distance(v, u)
+        d = self.find_distance(v, u, heuristic)
         if d is None:
             return None
 
@@ -299,6 +410,167 @@ class Graph:
 
         return r
 
+    def find_paths(self, v, u):
+        """Finds all shortest paths between two vertices (generator)
+        the search runs only once (up to u), the paths are then read from the predecessors of u, which are found as they are needed.
+        Doesn't change the "distance" of the vertices.
+
+        Args:
+            v (Vertex): Starting point
+            u (Vertex): Ending point
+
+        Yields:
+            list: Vertices of one shortest path, from v to u
+        """
+        distance = self._dijkstra(v, u)[0]
+        if distance[u.index] is None:
+            return
+        if u == v:
+            yield [u]
+            return
+
+        # the shortest-path DAG - for every vertex, the neighbors from which it can be reached optimally
+        dag = self._vertex_map()
+
+        def predecessors(x):
+            if dag[x.index] is None:
+                dag[x.index] = []
+                seen = set()
+                for y, weight in x.backtracks(True):
+                    d = distance[y.index]
+                    if (not d is None) and d + weight == distance[x.index] and not y.index in seen:
+                        seen.add(y.index)
+                        dag[x.index].append(y)
+            return dag[x.index]
+
+        # dfs from u backwards, the path and the stack of unfinished predecessor lists grow together
+        path = [u]
+        on_path = {u.index}
+        stack = [iter(predecessors(u))]
+        while stack:
+            for y in stack[-1]:
+                if y.index in on_path:
+                    continue
+                if y == v:
+                    yield [y] + path[::-1]
+                    continue
+                path.append(y)
+                on_path.add(y.index)
+                stack.append(iter(predecessors(y)))
+                break
+            else:
+                stack.pop()
+                on_path.discard(path.pop().index)
+
+    def find_k_paths(self, v, u, k=None):
+        """Finds the k shortest paths without repeated vertices, using Yen's algorithm (generator)
+        every next path is only searched for when it's asked for. Doesn't change the "distance" of the vertices.
+
+        Args:
+            v (Vertex): Starting point
+            u (Vertex): Ending point
+            k (int, optional): Maximum number of paths. Defaults to None (all of them).
+
+        Yields:
+            list: Vertices of a path, from v to u. The paths come ordered by their length.
+        """
+        if (not k is None) and k <= 0:
+            return
+        first = self._shortest_path(v, u)
+        if first is None:
+            return
+
+        # each path is stored as (indices of its vertices, its vertices, distances of its vertices from v)
+        found = [(tuple(x.index for x in first[0]),) + first]
+        yield first[0]
+
+        candidates = PriorityQueue()
+        seen = {found[0][0]}
+        while k is None or len(found) < k:
+            key, path, distances = found[-1]
+            for i in range(len(path) - 1):
+                # paths that start the same way as this one can't continue the same way
+                banned_edges = set((x[i], x[i+1]) for x, _, _ in found if len(x) > i+1 and x[:i+1] == key[:i+1])
+                banned_vertices = set(key[:i])
+
+                spur = self._shortest_path(path[i], u, banned_vertices, banned_edges)
+                if spur is None:
+                    continue
+                new_path = path[:i] + spur[0]
+                new_key = tuple(x.index for x in new_path)
+                if new_key in seen:
+                    continue
+                seen.add(new_key)
+                new_distances = distances[:i] + [distances[i] + d for d in spur[1]]
+                candidates.put((new_distances[-1], new_key, new_path, new_distances))
+
+            if candidates.empty():
+                return
+            _, key, path, distances = candidates.get()
+            found.append((key, path, distances))
+            yield path
+
+    def _dijkstra(self, v, u=None, heuristic=None, banned_vertices=(), banned_edges=()):
+        """Dijkstra's algorithm (A* with a heuristic), keeping its state to itself
+
+        Args:
+            v (Vertex): Starting point
+            u (Vertex, optional): Ending point, the search stops when it gets there. Defaults to None.
+            heuristic (function, optional): A* heuristic, see find_distance. Defaults to None.
+            banned_vertices (set, optional): indices of vertices the search can't go through
+            banned_edges (set, optional): pairs of indices (from, to) the search can't use
+
+        Returns:
+            tuple: (vertex map of distances, vertex map of the vertices the search came from,
+                list of all vertices that got a distance)
+        """
+        distance = self._vertex_map()
+        origin = self._vertex_map()
+        done = self._vertex_map()
+        distance[v.index] = 0
+        reached = [v]
+
+        # a vertex may be in the queue more times, only its first appearance (with the lowest distance) counts
+        queue = PriorityQueue()
+        queue.put((0 if heuristic is None else heuristic(v), v.index, v))
+        while not queue.empty():
+            w = queue.get()[2]
+            if done[w.index]:
+                continue
+            done[w.index] = True
+
+            if (not u is None) and w == u:
+                break
+
+            d = distance[w.index]
+            for x, weight in w.neighbors(True):
+                if x.index in banned_vertices or (w.index, x.index) in banned_edges:
+                    continue
+                if distance[x.index] is None:
+                    reached.append(x)
+                elif distance[x.index] <= d + weight:
+                    continue
+                distance[x.index] = d + weight
+                origin[x.index] = w
+                queue.put((d + weight + (0 if heuristic is None else heuristic(x)), x.index, x))
+
+        return distance, origin, reached
+
+    def _shortest_path(self, v, u, banned_vertices=(), banned_edges=()):
+        """
+        Returns:
+            tuple: (list of vertices of the path from v to u, list of their distances from v). None if there is no path
+        """
+        distance, origin, _ = self._dijkstra(v, u, None, banned_vertices, banned_edges)
+        if distance[u.index] is None:
+            return None
+
+        path = [u]
+        while not origin[path[-1].index] is None:
+            path.append(origin[path[-1].index])
+        path.reverse()
+        return path, [distance[x.index] for x in path]
+
     def export_graph_data(self):
         """exports graph to JSON
 
@@ -349,6 +621,8 @@ class Graph:
         elif "edges" in data.keys():
             raise ValueError("found edges, haven't found vertices")
 
+        self._reset_chunks()
+
     def add_vertex(self, value=None):
         """Adds a vertex to the current graph
 
@@ -358,6 +632,16 @@ class Graph:
         if value is None:value = self.N
         self.V.append(Vertex(self.N, value))
         self.N += 1
+        if not self._chunks is None:
+            self._dirty.add((self.N - 1) // _CHUNK)
+
+    def _vertex_map(self):
+        """a fresh list of length N for storing per-vertex state of an algorithm"""
+        return [None for _ in range(self.N)]
+
+    def _reset_distances(self):
+        for x in self.V:
+            x.distance = None
 
     def get_empty(self):
         return Graph(0, multigraph=self.is_multigraph, directed=self.is_directed, weighted=self.is_weighted)
@@ -378,7 +662,7 @@ class Graph:
         generator = self.bfs(v, priority, edge=True)
 
         r = self.get_empty()
-        vertex_map = [None for _ in range(self.N)]
+        vertex_map = self._vertex_map()
         for vertex, starting, weight in generator:
             r.add_vertex(vertex.value)
             vertex_map[vertex.index] = r.N - 1
@@ -441,16 +725,358 @@ class Graph:
         Returns:
             list: a list containing Graphs - components of the parent graph
         """
-        vertex_map = [None for _ in range(self.N)]
+        vertex_map = self._vertex_map()
 
         r = []
-        for i in range(len(vertex_map)):
+        for i in range(self.N):
             if vertex_map[i] is None:
                 r.append(self.get_component(self.vertex(i), vertex_map))
 
         return r
 
-            
+
+
+class GraphSnapshot:
+    """An immutable view of a Graph, as it was when it was published. Vertices are referred to by their indices,
+    or by SnapshotVertex objects from vertex() in the search functions (bfs, dfs, find_distance, find_path, find_paths, find_k_paths).
+    It can be shared between threads freely, reading from it never needs a lock.
+    """
+    __slots__ = ("N", "is_multigraph", "is_directed", "is_weighted", "version", "_chunks")
+
+    def __init__(self, g, chunks, N, version):
+        # the rows are split to chunks of _CHUNK vertices, each row is (value, edges) of one vertex
+        # and every edge is (index, v, w, weight, directed)
+        set_attribute = super().__setattr__
+        set_attribute("N", N)
+        set_attribute("is_multigraph", g.is_multigraph)
+        set_attribute("is_directed", g.is_directed)
+        set_attribute("is_weighted", g.is_weighted)
+        set_attribute("version", version)
+        set_attribute("_chunks", chunks)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("graph snapshots are immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("graph snapshots are immutable")
+
+    def __repr__(self):
+        return f"{self.N}-GraphSnapshot(version {self.version})"
+
+    def _row(self, index):
+        return self._chunks[index // _CHUNK][index % _CHUNK]
+
+    def _rows(self):
+        for chunk in self._chunks:
+            yield from chunk
+
+    def vertex(self, index):
+        """
+        Args:
+            index (int): Index of the vertex
+
+        Returns:
+            SnapshotVertex: the vertex, for use in the search functions
+        """
+        if not -self.N <= index < self.N:
+            return None
+        return SnapshotVertex(self, index % self.N)
+
+    def _vertex_map(self):
+        return [None for _ in range(self.N)]
+
+    # the searches of Graph, they only need vertex(), _vertex_map() and the neighbors of the vertices
+    dfs = Graph.dfs
+    bfs = Graph.bfs
+    find_paths = Graph.find_paths
+    find_k_paths = Graph.find_k_paths
+    _dijkstra = Graph._dijkstra
+    _shortest_path = Graph._shortest_path
+
+    def find_distance(self, v, u, heuristic=None):
+        """Finds distance between two vertices, like Graph.find_distance, but it can't store the distances in the vertices
+
+        Args:
+            v (SnapshotVertex): The vertex from which to calculate the distance
+            u (SnapshotVertex): The vertex to which to calculate the distance
+            heuristic (function, optional): A* heuristic, see Graph.find_distance. Defaults to None.
+
+        Returns:
+            int: Distance from v to u. None if there is no path between them
+        """
+        return self._dijkstra(v, u, heuristic)[0][u.index]
+
+    def find_path(self, v, u):
+        """Finds the shortest path between two vertices
+
+        Args:
+            v (SnapshotVertex): Starting point
+            u (SnapshotVertex): Ending point
+
+        Returns:
+            list: Vertices of the path, from v to u. None if there is no path
+        """
+        path = self._shortest_path(v, u)
+        return None if path is None else path[0]
+
+    def value(self, index):
+        return self._row(index)[0]
+
+    def neighbors(self, index, distance=False):
+        """same as Vertex.neighbors, but with indices instead of vertices"""
+        r = []
+        for _, v, w, weight, directed in self._row(index)[1]:
+            if v == index:x = w
+            elif directed:continue
+            else:x = v
+            r.append((x, weight) if distance else x)
+        return r
+
+    def backtracks(self, index, distance=False):
+        """same as Vertex.backtracks, but with indices instead of vertices"""
+        r = []
+        for _, v, w, weight, directed in self._row(index)[1]:
+            if w == index:x = v
+            elif directed:continue
+            else:x = w
+            r.append((x, weight) if distance else x)
+        return r
+
+    def export_graph_data(self):
+        """exports the snapshot to JSON, in the same format as Graph.export_graph_data
+
+        Returns:
+            dict: everything important about the graph
+        """
+        parameters = {
+            "N": self.N,
+            "is_weighted": self.is_weighted,
+            "is_multigraph": self.is_multigraph,
+            "is_directed": self.is_directed
+        }
+        vertices = [row[0] for row in self._rows()]
+        # every edge is in the rows of both its ends, it's exported from the row of its first end
+        edges = {}
+        for i, row in enumerate(self._rows()):
+            for index, v, w, weight, _ in row[1]:
+                if v == i:
+                    edges[index] = {"weight": weight, "v": v, "w": w}
+        edges = [edges[x] for x in sorted(edges.keys())]
+        return {"parameters": parameters, "vertices": vertices, "edges": edges}
+
+    def to_graph(self):
+        """creates a new (mutable) Graph from the snapshot
+
+        Returns:
+            Graph: the graph
+        """
+        g = Graph()
+        g.import_graph_data(self.export_graph_data())
+        return g
+
+
+class SnapshotVertex:
+    """A vertex of a GraphSnapshot, a light handle which is created whenever it is needed"""
+    __slots__ = ("snapshot", "index")
+
+    def __init__(self, snapshot, index):
+        self.snapshot = snapshot
+        self.index = index
+
+    def __hash__(self):
+        return hash(self.index)
+
+    def __eq__(self, other):
+        if isinstance(other, int):
+            return self.index == other
+        return self.index == other.index
+
+    def __lt__(self, other):
+        return self.index < other.index
+
+    def __repr__(self):
+        return "SnapshotVertex(" + str(self.index) + ")"
+
+    @property
+    def value(self):
+        return self.snapshot.value(self.index)
+
+    def neighbors(self, distance=False):
+        if distance:
+            return [(SnapshotVertex(self.snapshot, x), w) for x, w in self.snapshot.neighbors(self.index, True)]
+        return [SnapshotVertex(self.snapshot, x) for x in self.snapshot.neighbors(self.index)]
+
+    def backtracks(self, distance=False):
+        if distance:
+            return [(SnapshotVertex(self.snapshot, x), w) for x, w in self.snapshot.backtracks(self.index, True)]
+        return [SnapshotVertex(self.snapshot, x) for x in self.snapshot.backtracks(self.index)]
+
+
+class _LazyMap(dict):
+    """vertex map for implicit graphs, it only stores the vertices that were actually set"""
+
+    def __missing__(self, key):
+        return None
+
+
+class ImplicitVertex(Vertex):
+
+    def __init__(self, graph, index, value):
+        self.graph = graph
+        super().__init__(index, value)
+
+    @property
+    def distance(self):
+        return self._distance
+
+    @distance.setter
+    def distance(self, distance):
+        # the graph keeps the vertices with a distance alive until the next search resets them
+        self._distance = distance
+        if not distance is None:
+            self.graph._touched[self.index] = self
+
+    def neighbors(self, distance=False):
+        return self.graph._adjacent(self.index, self.graph._neighbors, distance)
+
+    def backtracks(self, distance=False):
+        return self.graph._adjacent(self.index, self.graph._backtracks, distance)
+
+
+class ImplicitGraph(Graph):
+    """A graph whose edges are never stored, they are generated by a function when needed.
+    Vertices (and their state, such as distance) are only created once an algorithm reaches them,
+    so bfs, dfs, find_distance and find_path can search huge grids without building them.
+    """
+
+    def __init__(self, N, neighbors, backtracks=None, values=None, directed=False, weighted=False):
+        """
+        Args:
+            N (int): number of vertices
+            neighbors (function): takes an index of a vertex, returns an iterable of indices of its neighbors
+                (pairs (index, weight) in weighted graphs)
+            backtracks (function, optional): same as neighbors, but against the direction of the edges.
+                Only needed by find_path in directed graphs. Defaults to neighbors in undirected graphs.
+            values (function, optional): takes an index of a vertex, returns its value. Defaults to the index.
+            directed (bool, optional): Defaults to False.
+            weighted (bool, optional): Defaults to False.
+        """
+        self.N = N
+        self.E = []
+        self.is_multigraph = False
+        self.is_directed = directed
+        self.is_weighted = weighted
+        self._neighbors = neighbors
+        if backtracks is None and not directed:
+            backtracks = neighbors
+        self._backtracks = backtracks
+        self._values = values
+        # vertices are kept only while something uses them - a search (through _touched) or the caller
+        self._V = WeakValueDictionary()
+        self._touched = {}
+
+    def __repr__(self):
+        return f"{self.N}-ImplicitGraph()"
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_V"], state["_touched"] = None, None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._V = WeakValueDictionary()
+        self._touched = {}
+
+    def __eq__(self, other):
+        return self is other
+
+    def _adjacent(self, index, function, distance):
+        if function is None:
+            raise TypeError("directed implicit graphs need the backtracks function to go against the edges")
+        r = []
+        for x in function(index):
+            if self.is_weighted:x, weight = x
+            else:weight = 1
+            x = self.vertex(x)
+            r.append((x, weight) if distance else x)
+        return r
+
+    def vertex(self, index=None, value=None):
+        """gets a Vertex object with a given index, creating it on first use
+
+        Args:
+            index (int): Index of the vertex
+            value: not supported, implicit vertices can only be looked up by index
+
+        Returns:
+            ImplicitVertex: Vertex with the given index
+        """
+        if index is None or not -self.N <= index < self.N:
+            return None
+        index = index % self.N
+        x = self._V.get(index)
+        if x is None:
+            value = index if self._values is None else self._values(index)
+            x = ImplicitVertex(self, index, value)
+            self._V[index] = x
+        return x
+
+    def _vertex_map(self):
+        return _LazyMap()
+
+    def _reset_distances(self):
+        # only the vertices which got a distance in the last search need resetting
+        touched, self._touched = self._touched, {}
+        for x in touched.values():
+            x._distance = None
+
+    def get_components(self):
+        raise TypeError("components of an implicit graph would build all of it, use get_component instead")
+
+    def connect(self, v, w, weight=1):
+        raise TypeError("edges of an implicit graph are given by its neighbors function")
+
+    def add_vertex(self, value=None):
+        raise TypeError("an implicit graph has a fixed number of vertices")
+
+    def import_graph_data(self, data):
+        raise TypeError("an implicit graph cannot be imported, import a Graph instead")
+
+    def export_graph_data(self):
+        raise TypeError("an implicit graph cannot be exported, export its induced subgraph instead")
+
+    def publish(self):
+        raise TypeError("an implicit graph cannot change, there is nothing to publish")
+
+    def snapshot(self):
+        raise TypeError("an implicit graph cannot change, it doesn't need snapshots")
+
+    def get_induced_subgraph(self, vertices):
+        """creates an induced subgraph from a list of vertices, it is a regular (materialized) Graph
+
+        Args:
+            vertices (list): list of vertices
+
+        Returns:
+            Graph: Induced subgraph
+        """
+        # the vertices are gone through twice, they may come from a generator (get_component)
+        vertices = list(vertices)
+        vertex_map = {}
+        g = self.get_empty()
+
+        for x in vertices:
+            vertex_map[x.index] = g.N
+            g.add_vertex(x.value)
+
+        for x in vertices:
+            for y, weight in x.neighbors(True):
+                if y.index in vertex_map:
+                    g.connect(g.vertex(vertex_map[x.index]), g.vertex(vertex_map[y.index]), weight)
+
+        return g
+
 
 if __name__ == '__main__':
     G = Graph(6, weighted=True)
@@ -1,7 +1,10 @@
 #! /bin/python3
 
-import command_interface, graph
+import command_interface, graph, analytics, centrality
 import json, pathlib, os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 GRAPHS = {}
 
 # -------------------------------------------------------------------
@@ -19,6 +22,66 @@ def _get_graph(name):
     if name in GRAPHS.keys():return GRAPHS[name]
     else:raise KeyError("Graph Not Found")
 
+def _load_graph_file(file_path):
+    with open(file_path) as f:
+        return json.load(f)
+
+def _load_graph(file_path):
+    g = graph.Graph()
+    g.import_graph_data(_load_graph_file(file_path))
+    return g
+
+def _dump_graph_file(file_path, g_data):
+    with open(file_path, "w") as f:
+        json.dump(g_data, f, indent=4)
+
+def _collect(task, future):
+    try:return task, future.result(), None
+    except Exception as e:return task, None, e
+
+def _run_batch(func, tasks, workers=0):
+    """runs func(*task) for every task in a pool of worker processes (generator)
+    only a few tasks per worker are in flight at once, so tasks can be produced lazily
+    if a worker dies, the tasks in flight are reported as failed and the rest runs in a new pool
+
+    Args:
+        func (function): module-level function to run in the workers
+        tasks (iterable): tuples of arguments for func
+        workers (int, optional): number of worker processes. Defaults to one per CPU.
+
+    Yields:
+        tuple: (task, result, error) in the order of the tasks, error is None if func succeeded
+    """
+    if workers <= 0:workers = os.cpu_count() or 1
+
+    # with one worker, a pool would only add the cost of sending everything between processes
+    if workers == 1:
+        for task in tasks:
+            try:yield task, func(*task), None
+            except Exception as e:yield task, None, e
+        return
+
+    pending = deque()
+    pool = ProcessPoolExecutor(workers)
+    try:
+        for task in tasks:
+            try:future = pool.submit(func, *task)
+            except BrokenProcessPool:
+                # a worker died (killed, out of memory, ...) - the tasks in flight fail with it,
+                # the rest of the batch goes to a new pool
+                while pending:
+                    yield _collect(*pending.popleft())
+                pool.shutdown()
+                pool = ProcessPoolExecutor(workers)
+                future = pool.submit(func, *task)
+            pending.append((task, future))
+            if len(pending) >= 2 * workers:
+                yield _collect(*pending.popleft())
+        while pending:
+            yield _collect(*pending.popleft())
+    finally:
+        pool.shutdown()
+
 # -------------------------------------------------------------------
 # USER INPUT HANDLERS
 # -------------------------------------------------------------------
@@ -61,31 +124,46 @@ def print_graph(name):
         print(e.visualize())
 
 def import_graph(name, file_path, exclusive=False):
-    with open(file_path) as f:
-        g_data = json.load(f)
-
-    g = graph.Graph()
-    g.import_graph_data(g_data)
+    g = _load_graph(file_path)
     _save_graph(name, g, exclusive)
 
 def export_graph(name, path):
     g = _get_graph(name)
-    
-    with open(path, "w") as f:
-        json.dump(g.export_graph_data(), f, indent=4)
+    _dump_graph_file(path, g.export_graph_data())
 
-def export_all(path):
+def export_all(path, workers=0):
     path = pathlib.Path(path)
     if not path.exists():
         os.makedirs(path)
-    for x in GRAPHS.keys():
-        export_graph(x, path / (x + ".json"))
 
-def import_all(path):
+    # graphs are exported one by one as the pool asks for more work
+    names = list(GRAPHS.keys())
+    tasks = ((path / (x + ".json"), GRAPHS[x].export_graph_data()) for x in names)
+
+    failed = 0
+    for (file_path, _), _, error in _run_batch(_dump_graph_file, tasks, workers):
+        if not error is None:
+            failed += 1
+            print(f"Failed to export {file_path.name}: {error}")
+    print(f"Exported {len(names) - failed} of {len(names)} graphs")
+
+def import_all(path, workers=0):
     path = pathlib.Path(path)
-    for x in os.listdir(path):
+    # sorted, so that the names given by the exclusive rule don't depend on the order of the directory listing
+    files = sorted(os.listdir(path))
+    tasks = ((path / x,) for x in files)
+
+    # the graphs are built in the workers, only saving them (in the sorted order) is left for this process
+    failed = 0
+    for (file_path,), g, error in _run_batch(_load_graph, tasks, workers):
+        x = file_path.name
         name = x[:-5] if x.endswith(".json") else x
-        import_graph(name, path / x, exclusive=True)
+        if error is None:
+            _save_graph(name, g, exclusive=True)
+        else:
+            failed += 1
+            print(f"Failed to import {x}: {error}")
+    print(f"Imported {len(files) - failed} of {len(files)} graphs")
 
 def split_to_components(name):
     g = _get_graph(name)
@@ -108,6 +186,42 @@ def find_path(name, u, v):
         for x in path_graph.bfs(path_graph.vertex(-1)):
             print(f"Vertex {x.value}")
 
+def graph_stats(name, samples):
+    g = _get_graph(name)
+    stats = analytics.graph_stats(g, samples)
+
+    print("V:", stats["vertices"], "E:", stats["edges"])
+    print("---DEGREES------")
+    for degree, count in stats["degree_histogram"].items():
+        print(str(degree) + ":", count)
+    print()
+    print("Diameter (lower bound):", stats["diameter_lower_bound"])
+    if not stats["eccentricity"] is None:
+        e = stats["eccentricity"]
+        print(f"Eccentricity of {e['samples']} sampled vertices: min {e['min']}, max {e['max']}, mean {e['mean']:.2f}")
+    print("Triangles:", stats["triangles"])
+    print(f"Average clustering: {stats['average_clustering']:.4f}")
+    print(f"Transitivity: {stats['transitivity']:.4f}")
+
+def vertex_centrality(name, samples, workers):
+    g = _get_graph(name)
+    # 0 samples means the exact result
+    samples = samples if samples > 0 else None
+    between, close = centrality.centrality(g, samples, workers=workers)
+
+    for i, x in enumerate(g.V):
+        print(str(i) + ":", x.value, f"betweenness {between[i]:.4f}", f"closeness {close[i]:.4f}")
+
+def find_paths(name, u, v):
+    g = _get_graph(name)
+    for i, path in enumerate(g.find_paths(g.vertex(u), g.vertex(v))):
+        print(f"Path {i+1}:", " ".join(str(x.value) for x in path))
+
+def find_k_paths(name, u, v, k):
+    g = _get_graph(name)
+    for i, path in enumerate(g.find_k_paths(g.vertex(u), g.vertex(v), k)):
+        print(f"Path {i+1}:", " ".join(str(x.value) for x in path))
+
 # -------------------------------------------------------------------
 # MENU
 # -------------------------------------------------------------------
@@ -122,16 +236,22 @@ menu.add_commands([
     ["add_edge name starting_vertex_index:int end_vertex_index:int",add_edge, "creates a new edge in a graph, for weighted graphs you will be prompted for the weight as well"],
     ["import_graph name file_path",import_graph, "import a graph from a json file specified by file_path"],
     ["export_graph name file_path",export_graph, "export a graph to a json file, location specified by file_path"],
-    ["export_all dir_name",export_all, "export all graphs from memory to a directory"],
-    ["import_all dir_name",import_all, "import all files from a specified directory to memory (there cannot be any other files in the directory!)"],
+    ["export_all dir_name workers:int",export_all, "export all graphs from memory to a directory, using a given number of worker processes (0 = one per CPU)"],
+    ["import_all dir_name workers:int",import_all, "import all files from a specified directory to memory, using a given number of worker processes (0 = one per CPU). Files that fail to load are reported and skipped"],
     ["split_to_components name",split_to_components, "split a graph to components and save them to memory (the old graph will remain in memory, the components will be called [original_name]_component_[component_number]"],
     ["find_distance name index_of_start:int index_of_end:int",find_distance, "find a distance between two vertices (vertices are specified by their indices, for more info look at get_vertex_indices command)"],
     ["find_path name index_of_start:int index_of_end:int",find_path, "find a shortest path between two vertices (vertices are specified by their indices, for more info look at get_vertex_indices command)"],
+    ["graph_stats name samples:int",graph_stats, "print the degree histogram, an estimate of the diameter, eccentricity of a given number of sampled vertices, the number of triangles and clustering"],
+    ["centrality name samples:int workers:int",vertex_centrality, "print betweenness and closeness centrality of every vertex, estimated from a given number of sampled vertices (0 = exact), computed by a given number of processes (0 = one per CPU)"],
+    ["find_paths name index_of_start:int index_of_end:int",find_paths, "find all shortest paths between two vertices"],
+    ["find_k_paths name index_of_start:int index_of_end:int k:int",find_k_paths, "find k shortest paths (without repeating vertices) between two vertices, ordered by length"],
 ])
 
-while True:
-    try:
-        if menu.input_from_menu() == "EXIT":break
-    except Exception as e:
-        print(e)
-        input("Press ENTER to continue...") 
+# the worker processes import this module too, they must not start the menu
+if __name__ == '__main__':
+    while True:
+        try:
+            if menu.input_from_menu() == "EXIT":break
+        except Exception as e:
+            print(e)
+            input("Press ENTER to continue...") 